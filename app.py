@@ -1,45 +1,152 @@
 import streamlit as st
 import requests
+import httpx
+import orjson
+import asyncio
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random # Import the random library
+import threading
+import html
+import time
+from collections import OrderedDict
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+import async_http
 
 # --- Page Configuration ---
 # Set the page to wide layout for more space
 st.set_page_config(layout="wide", page_title="MET Artwork Explorer")
 ITEMS_PER_PAGE = 10
+# (connect, read) timeouts in seconds for every MET API call
+REQUEST_TIMEOUT = (3.05, 10)
+# Retry policy shared by the requests session and the httpx client
+RETRY_TOTAL = 2
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+# Upper bound on waiting for one batch of detail fetches: every attempt timing
+# out on connect and read, plus the backoff sleeps between attempts
+BATCH_FETCH_TIMEOUT = (RETRY_TOTAL + 1) * sum(REQUEST_TIMEOUT) + sum(
+    RETRY_BACKOFF_FACTOR * 2 ** attempt for attempt in range(RETRY_TOTAL)
+)
+
+# --- HTTP Session ---
+# Use st.cache_resource so one pooled, keep-alive session survives reruns
+# instead of opening a new TCP+TLS connection for every API call.
+@st.cache_resource
+def get_http_session():
+    """Creates a shared requests.Session with connection pooling and retries."""
+    session = requests.Session()
+    retries = Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF_FACTOR, status_forcelist=RETRY_STATUS_CODES)
+    session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retries))
+    return session
 
 # --- API Functions (with Caching) ---
 # Use st.cache_data to cache API responses
-@st.cache_data
-def get_departments():
-    """Fetches the list of departments from the MET API."""
+# Responses are decoded with orjson, which is much faster than response.json()
+# on large payloads like the highlights list.
+# Departments and highlights change at most daily, so they are persisted to
+# disk and survive app restarts. Persisted caches ignore `ttl`, so each fetcher
+# returns its fetch time and _load_daily re-fetches once that is over a day old.
+# The fetchers raise instead of returning [] so an error response is never persisted.
+DAILY_REFRESH = 86400 # seconds
+
+@st.cache_data(persist="disk")
+def _fetch_departments():
+    response = get_http_session().get("https://collectionapi.metmuseum.org/public/collection/v1/departments", timeout=REQUEST_TIMEOUT)
+    response.raise_for_status() # Raise an error for bad responses
+    departments = orjson.loads(response.content).get("departments", [])
+    if not departments:
+        raise requests.RequestException("The API returned no departments")
+    return time.time(), departments
+
+def _load_daily(fetch):
+    """
+    Returns (fetched_at, value) from a disk-persisted fetcher, re-fetching once
+    the stored value is over a day old. fetch.clear() also deletes the old
+    entry from disk, so each fetcher keeps a single persisted file.
+    """
+    fetched_at, value = fetch()
+    if time.time() - fetched_at > DAILY_REFRESH:
+        fetch.clear()
+        fetched_at, value = fetch()
+    return fetched_at, value
+
+# Streamlit reruns the whole script on every interaction, so build the
+# dropdown names and name -> ID map once per fetch instead of on every rerun.
+@st.cache_data(max_entries=1, show_spinner=False)
+def _build_department_index(fetched_at, _departments):
+    dept_names = ["All Departments"] + [dept['displayName'] for dept in _departments]
+    dept_map = {dept['displayName']: dept['departmentId'] for dept in _departments}
+    dept_map["All Departments"] = None
+    return dept_names, dept_map
+
+# Errors never reach the caches above, so during an MET outage every rerun would
+# block on the fetch and its retries again. Remember the outcome (success or
+# error message) in memory for a short while instead.
+FAILED_FETCH_TTL = 60 # seconds
+
+@st.cache_data(ttl=FAILED_FETCH_TTL, show_spinner=False)
+def _load_department_index():
     try:
-        response = requests.get("https://collectionapi.metmuseum.org/public/collection/v1/departments")
-        response.raise_for_status() # Raise an error for bad responses
-        data = response.json()
-        return data.get("departments", [])
-    except requests.RequestException as e:
-        st.error(f"Error fetching departments: {e}")
-        return []
+        return _build_department_index(*_load_daily(_fetch_departments)), None
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        return None, str(e)
+
+def get_department_index():
+    """Returns the department dropdown names and a map of department name -> ID."""
+    dept_index, error = _load_department_index()
+    if error:
+        st.error(f"Error fetching departments: {error}")
+        return ["All Departments"], {"All Departments": None}
+    return dept_index
+
+# The spinner only appears on a cache miss, so warm "Surprise Me!" clicks are instant.
+# Its text stays neutral because the no-results fallback also loads this list.
+@st.cache_data(persist="disk", show_spinner="Loading MET highlights...")
+def _fetch_all_highlights():
+    response = get_http_session().get("https://collectionapi.metmuseum.org/public/collection/v1/search?isHighlight=true&q=", timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    object_ids = orjson.loads(response.content).get("objectIDs") or []
+    if not object_ids:
+        raise requests.RequestException("The API returned no highlights")
+    return time.time(), object_ids
+
+@st.cache_data(ttl=FAILED_FETCH_TTL, show_spinner=False)
+def _load_all_highlights():
+    try:
+        _, object_ids = _load_daily(_fetch_all_highlights)
+        return object_ids, None
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        return None, str(e)
 
 # --- NEW: Function to get all highlights for the "Surprise Me" feature ---
-@st.cache_data
 def get_all_highlights():
     """Fetches all object IDs that are marked as highlights."""
-    try:
-        response = requests.get("https://collectionapi.metmuseum.org/public/collection/v1/search?isHighlight=true&q=")
-        response.raise_for_status()
-        data = response.json()
-        return data.get("objectIDs", [])
-    except requests.RequestException as e:
-        st.error(f"Error fetching highlights: {e}")
+    object_ids, error = _load_all_highlights()
+    if error:
+        st.error(f"Error fetching highlights: {error}")
         return []
+    return object_ids
+
+def get_random_highlight():
+    """
+    Picks one random highlighted object ID, or None if highlights are unavailable.
+    Deliberately not cached: only the highlights list is, so every call is a new pick.
+    """
+    highlights = get_all_highlights()
+    return random.choice(highlights) if highlights else None
 
-@st.cache_data
-def search_artworks(query, department_id, is_highlight, date_begin=None, date_end=None): # Add date params
+# Large searches can return 10,000+ IDs, so keep only a few of them cached
+@st.cache_data(ttl=1800, max_entries=32)
+def search_artworks(params_tuple):
     """
-    Searches the MET API based on query, department, and highlight status.
-    Returns a list of object IDs.
+    Searches the MET API based on query, department, highlight status and dates.
+    Takes a single tuple from normalize_search_args so Streamlit hashes one
+    argument for the cache key instead of five.
+    Returns a tuple of object IDs (immutable, and cheaper to copy and pickle than a list).
     """
+    query, department_id, is_highlight, date_begin, date_end = params_tuple
     search_url = "https://collectionapi.metmuseum.org/public/collection/v1/search"
     params = {
         'q': query,
@@ -57,28 +164,323 @@ def search_artworks(query, department_id, is_highlight, date_begin=None, date_en
         del params['departmentId']
         
     try:
-        response = requests.get(search_url, params=params)
+        response = get_http_session().get(search_url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-        return data.get("objectIDs", [])
+        data = orjson.loads(response.content)
+        return tuple(data.get("objectIDs") or ())
     except requests.RequestException as e:
         st.error(f"Error searching API: {e}")
-        return []
+        return ()
     except Exception as e:
         st.error(f"An unexpected error occurred: {e}")
-        return []
+        return ()
+
+def normalize_search_args(query, department_id, is_highlight, date_begin=None, date_end=None):
+    """
+    Builds the params tuple for search_artworks, with canonical types.
+    The cache key is a hash of the arguments, so e.g. 1880.0 vs 1880 or
+    "Cat " vs "cat" would otherwise be separate cache misses for the same search.
+    """
+    return (
+        (query or "").strip().lower(),
+        department_id,
+        bool(is_highlight),
+        int(date_begin) if date_begin is not None else None,
+        int(date_end) if date_end is not None else None,
+    )
 
-@st.cache_data
-def get_object_details(object_id):
-    """Fetches the full details for a single object ID."""
+# --- Object Details Cache ---
+# Bounded LRU + TTL instead of clearing the whole cache on every new search.
+# st.cache_data can't be asked which IDs it already holds without running the
+# function, so object details live in a per-ID cache that every page, search,
+# fallback and "Surprise Me!" pick shares; only the misses hit the API.
+OBJECT_CACHE_MAX_ENTRIES = 512
+OBJECT_CACHE_TTL = 3600 # seconds
+
+@st.cache_resource
+def get_object_cache():
+    """
+    Creates the shared object cache: an {object_id: (fetched_at, details, markdown)}
+    LRU, an {object_id: Future} map of fetches still in flight, and their lock.
+    """
+    return OrderedDict(), {}, threading.Lock()
+
+def _store_cached_objects(cache, details_by_id):
+    # Caller holds the object cache lock
+    now = time.monotonic()
+    for object_id, details in details_by_id.items():
+        # The markdown is built once per fetch and stored with its details,
+        # so the two always expire and get evicted together
+        cache[object_id] = (now, details, build_details_markdown(details))
+        cache.move_to_end(object_id)
+    while len(cache) > OBJECT_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+async def _fetch_object(client, object_id):
+    url = f"https://collectionapi.metmuseum.org/public/collection/v1/objects/{object_id}"
     try:
-        response = requests.get(f"https://collectionapi.metmuseum.org/public/collection/v1/objects/{object_id}")
+        # Same policy as the requests session: retry throttling and server errors
+        # with a short backoff (connection errors are retried by the transport)
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await client.get(url)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == RETRY_TOTAL:
+                break
+            await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException:
+        return orjson.loads(response.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError):
         # Don't show an error for every failed object, just return None
         return None
 
+async def _fetch_many(client, ids):
+    """Returns {object_id: details} for the IDs that were fetched successfully."""
+    results = await asyncio.gather(*[_fetch_object(client, object_id) for object_id in ids])
+    return {object_id: details for object_id, details in zip(ids, results) if details is not None}
+
+def _make_async_http_client():
+    # http2/limits go on the transport: httpx ignores the client's own when one is given
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=httpx.Limits(max_connections=20), retries=RETRY_TOTAL)
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+    )
+
+def get_async_http_client():
+    """
+    Returns the shared httpx.AsyncClient and the event loop it runs on.
+    An AsyncClient is bound to one event loop, so both are a singleton in
+    async_http (not st.cache_resource, whose "Clear cache" would leave the old
+    loop thread and connection running) and every batch is submitted to it.
+    One HTTP/2 connection then multiplexes requests across reruns and users.
+    """
+    return async_http.get_client(_make_async_http_client)
+
+def _wait_for_fetch(future):
+    """Waits for a batch from _fetch_many, returning {} if it timed out or was cancelled."""
+    try:
+        return future.result(timeout=BATCH_FETCH_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        # e.g. the async-http loop thread died; treat the whole batch as misses
+        future.cancel()
+        return {}
+    except concurrent.futures.CancelledError:
+        return {}
+
+def get_many_object_details(object_ids, object_cache=None):
+    """
+    Fetches details for several object IDs, keeping the same order.
+    Cached IDs return without a network call, IDs another caller is already
+    fetching (e.g. the next-page prefetch) wait for that fetch, and only the
+    rest are fetched concurrently on the shared client. Failed fetches (None)
+    are not cached. Background threads pass `object_cache` in so they make no
+    Streamlit calls themselves.
+    """
+    cache, in_flight, lock = object_cache or get_object_cache()
+    found, waiting, misses = {}, {}, []
+    now = time.monotonic()
+    with lock:
+        # Sorted under one lock so a fetch finishing in between can't be started twice
+        for object_id in dict.fromkeys(object_ids):
+            entry = cache.get(object_id)
+            if entry and now - entry[0] < OBJECT_CACHE_TTL:
+                cache.move_to_end(object_id)
+                found[object_id] = entry[1]
+            elif object_id in in_flight:
+                waiting[object_id] = in_flight[object_id]
+            else:
+                misses.append(object_id)
+        if misses:
+            loop, client = get_async_http_client()
+            future = asyncio.run_coroutine_threadsafe(_fetch_many(client, misses), loop)
+            for object_id in misses:
+                in_flight[object_id] = future
+
+    if misses:
+        fetched = _wait_for_fetch(future)
+        with lock:
+            _store_cached_objects(cache, fetched)
+            for object_id in misses:
+                in_flight.pop(object_id, None)
+        found.update(fetched)
+
+    for object_id, in_flight_future in waiting.items():
+        details = _wait_for_fetch(in_flight_future).get(object_id)
+        if details is not None:
+            found[object_id] = details
+
+    return [found.get(object_id) for object_id in object_ids]
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Creates a shared thread pool used to warm the cache for the next page."""
+    return ThreadPoolExecutor(max_workers=ITEMS_PER_PAGE)
+
+def prefetch_object_details(object_ids):
+    """
+    Starts fetching details in the background without waiting for them.
+    Results land in the per-ID object cache, so the next page loads warm.
+    Skipped if this session already prefetched the same IDs, since the whole
+    script reruns on every widget interaction.
+    """
+    object_ids = tuple(object_ids)
+    if st.session_state.prefetched_ids == object_ids:
+        return
+    st.session_state.prefetched_ids = object_ids
+    # Pool threads are shared across sessions and have no ScriptRunContext, so the
+    # object cache is looked up here and the worker never calls into Streamlit
+    get_prefetch_executor().submit(get_many_object_details, object_ids, get_object_cache())
+
+# --- Rendering Helpers ---
+def get_thumbnail_url(img_url):
+    """
+    Swaps a full-size MET image URL for its web-large variant.
+    MET serves both as .../original/<file> and .../web-large/<file>
+    (the latter is what primaryImageSmall points to).
+    """
+    return img_url.replace("/original/", "/web-large/", 1)
+
+def build_details_markdown(details):
+    """
+    Builds the artwork's text details as a single markdown string.
+    One st.markdown call is one frontend message, instead of one per st.write.
+    """
+    md = [f"**Artist:** {details.get('artistDisplayName', 'Unknown')}"]
+
+    artist_bio = details.get('artistDisplayBio')
+    if artist_bio:
+        md.append(f"**Artist Bio:** {artist_bio}")
+
+    md.append(f"**Date:** {details.get('objectDate', 'Unknown')}")
+    md.append(f"**Medium:** {details.get('medium', 'Unknown')}")
+
+    obj_name = details.get('objectName')
+    if obj_name:
+        md.append(f"**Object Type:** {obj_name}")
+
+    culture = details.get('culture')
+    if culture:
+        md.append(f"**Culture:** {culture}")
+
+    period = details.get('period')
+    if period:
+        md.append(f"**Period:** {period}")
+
+    dims = details.get('dimensions')
+    if dims:
+        md.append(f"**Dimensions:** {dims}")
+
+    md.append(f"**Department:** {details.get('department', 'Unknown')}")
+
+    credit = details.get('creditLine')
+    if credit:
+        md.append(f"**Credit Line:** {credit}")
+
+    return "\n\n".join(md)
+
+def get_details_markdown(object_id, details):
+    """
+    Returns the markdown stored with `details` in the object cache.
+    Falls back to building it when the entry has since been evicted or
+    refetched (it no longer holds this same `details` object).
+    """
+    cache, _, lock = get_object_cache()
+    with lock:
+        entry = cache.get(object_id)
+    if entry and entry[1] is details:
+        return entry[2]
+    return build_details_markdown(details)
+
+@st.fragment
+def render_artwork(object_id, details):
+    """
+    Renders one artwork: image, details, additional images and tag buttons.
+    As a fragment, interacting with it reruns only this block; buttons that
+    start a new search call st.rerun() to refresh the whole app on purpose.
+    """
+    # Handle artworks with no public domain image
+    if not details.get("primaryImageSmall"):
+        st.write(f"**{details.get('title', 'Untitled')}** by {details.get('artistDisplayName', 'Unknown')}")
+        st.warning("This artwork has no image available for display.")
+        if details.get("objectURL"):
+            st.link_button("View on MET Website", details["objectURL"])
+        st.divider()
+        return # Skip the rest of the layout
+
+    # Use columns for a clean layout: Image on left, text on right
+    img_col, text_col = st.columns([1, 3])
+
+    with img_col:
+        st.image(
+            details.get("primaryImageSmall"),
+            caption=details.get("objectDate", ""),
+            use_column_width=True
+        )
+
+    with text_col:
+        st.subheader(details.get("title", "Untitled"))
+
+        # --- NEW: More Details ---
+        # All plain-text details go out as one markdown element
+        st.markdown(get_details_markdown(object_id, details))
+        # --- END More Details ---
+
+        # --- NEW: "More from this Artist" Button ---
+        artist_name = details.get('artistDisplayName')
+        if artist_name and artist_name != "Unknown":
+            if st.button(f"More from {artist_name}", key=f"artist_{object_id}"):
+                st.session_state.page = 0
+                # Search for this artist, clearing other filters
+                with st.spinner(f"Finding more from {artist_name}..."):
+                    st.session_state.search_results = search_artworks(normalize_search_args(
+                        query=artist_name,
+                        department_id=None,
+                        is_highlight=False
+                    ))
+                st.rerun()
+        # --- END NEW ---
+
+        # Add a link to the official MET page
+        if details.get("objectURL"):
+            st.link_button("View on MET Website", details["objectURL"])
+
+    # --- NEW: Additional Images Gallery ---
+    additional_images = details.get("additionalImages")
+    if additional_images:
+        st.write("**Additional Images:**")
+        # Create a gallery with up to 4 columns
+        num_images = len(additional_images)
+        cols = st.columns(min(num_images, 4))
+        for i, img_url in enumerate(additional_images[:4]):
+            with cols[i]:
+                # Plain <img> so the browser lazy-loads thumbnails that are off-screen
+                thumb_url = html.escape(get_thumbnail_url(img_url), quote=True)
+                st.markdown(f'<img src="{thumb_url}" loading="lazy" width="150">', unsafe_allow_html=True)
+    # --- END Additional Images ---
+
+    # --- NEW: Interactive Tags ---
+    tags = details.get("tags")
+    if tags and isinstance(tags, list):
+        tag_terms = [tag.get("term") for tag in tags if tag.get("term")]
+        if tag_terms:
+            st.write("**Explore Tags:**")
+            # Use columns to lay out tags, max 5 per row for tidiness
+            num_cols = min(len(tag_terms), 5)
+            tag_cols = st.columns(num_cols)
+            for i, term in enumerate(tag_terms):
+                with tag_cols[i % num_cols]:
+                    if st.button(term, key=f"tag_{object_id}_{term}"):
+                        st.session_state.page = 0
+                        with st.spinner(f"Searching for '{term}'..."):
+                            st.session_state.search_results = search_artworks(normalize_search_args(
+                                query=term,
+                                department_id=None,
+                                is_highlight=False
+                            ))
+                        st.rerun()
+    # --- END NEW ---
+
+    st.divider() # Add a line between results
+
 # --- Session State Initialization ---
 # This is used to remember the current page number and search results
 # even when the app re-runs.
@@ -86,23 +488,21 @@ def get_object_details(object_id):
 if 'page' not in st.session_state:
     st.session_state.page = 0
 if 'search_results' not in st.session_state:
-    st.session_state.search_results = []
+    st.session_state.search_results = ()
 # Add a new state to track if we're showing fallback results
 if 'show_fallback' not in st.session_state:
     st.session_state.show_fallback = False
+# The next-page IDs already handed to the background prefetch
+if 'prefetched_ids' not in st.session_state:
+    st.session_state.prefetched_ids = ()
 
 # --- UI Layout: Sidebar (Filters) ---
 st.sidebar.title("🖼️ MET Artwork Explorer")
 st.sidebar.header("Search & Filter")
 
 # 1. Load departments for the dropdown
-departments = get_departments()
-dept_names = ["All Departments"] + [dept['displayName'] for dept in departments]
-
-# 2. Build a map of department name -> ID
-# --- THIS IS THE FIXED LINE ---
-dept_map = {dept['displayName']: dept['departmentId'] for dept in departments}
-dept_map["All Departments"] = None
+# 2. Build a map of department name -> ID (both cached across reruns)
+dept_names, dept_map = get_department_index()
 
 # 3. Sidebar widgets
 selected_dept_name = st.sidebar.selectbox("Filter by Department:", dept_names)
@@ -128,7 +528,7 @@ if st.sidebar.button("Search", type="primary"):
     st.session_state.page = 0
     with st.spinner("Searching for artworks..."):
         # Pass date params to the search function
-        object_ids = search_artworks(search_query, selected_dept_id, is_highlight, date_begin, date_end)
+        object_ids = search_artworks(normalize_search_args(search_query, selected_dept_id, is_highlight, date_begin, date_end))
         
         # --- NEW FALLBACK LOGIC ---
         # If the user searched for *something* but got no results...
@@ -136,33 +536,27 @@ if st.sidebar.button("Search", type="primary"):
         if not object_ids and (search_query or selected_dept_name != "All Departments" or is_highlight or date_begin or date_end):
             # ...set a flag to show a message...
             st.session_state.show_fallback = True
-            # ...and instead search for general highlights.
-            object_ids = search_artworks(query="", department_id=None, is_highlight=True)
+            # ...and instead show general highlights (same list that powers "Surprise Me!", already cached).
+            object_ids = get_all_highlights()
         else:
             # Otherwise, it's a normal search, so no fallback message.
             st.session_state.show_fallback = False
         # --- END NEW LOGIC ---
 
-        st.session_state.search_results = object_ids
-        # Clear the cache for object details if a new search is made
-        get_object_details.clear()
+        st.session_state.search_results = tuple(object_ids)
 
 # --- NEW: "Surprise Me!" Button ---
 st.sidebar.divider()
 if st.sidebar.button("Surprise Me! 🎲"):
-    with st.spinner("Finding a masterpiece..."):
-        st.session_state.page = 0
-        highlights = get_all_highlights()
-        if highlights:
-            # Pick one random ID from the highlights
-            random_id = random.choice(highlights)
-            st.session_state.search_results = [random_id] # Show only the one random artwork
-        else:
-            st.session_state.search_results = []
-        
-        st.session_state.show_fallback = False
-        get_object_details.clear()
-        st.rerun() # Rerun to reflect the new state immediately
+    st.session_state.page = 0
+    random_id = get_random_highlight()
+    if random_id is not None:
+        st.session_state.search_results = (random_id,) # Show only the one random artwork
+    else:
+        st.session_state.search_results = ()
+
+    st.session_state.show_fallback = False
+    st.rerun() # Rerun to reflect the new state immediately
 # --- END NEW ---
 
 
@@ -205,121 +599,15 @@ else:
     st.divider()
 
     # --- Display Results ---
-    # Fetch details and display them
-    for object_id in ids_to_show:
-        with st.spinner(f"Loading artwork {object_id}..."):
-            details = get_object_details(object_id)
-        
-        if details:
-            # Handle artworks with no public domain image
-            if not details.get("primaryImageSmall"):
-                st.write(f"**{details.get('title', 'Untitled')}** by {details.get('artistDisplayName', 'Unknown')}")
-                st.warning("This artwork has no image available for display.")
-                if details.get("objectURL"):
-                    st.link_button("View on MET Website", details["objectURL"])
-                st.divider()
-                continue # Skip to the next artwork
-            
-            # Use columns for a clean layout: Image on left, text on right
-            img_col, text_col = st.columns([1, 3])
-            
-            with img_col:
-                st.image(
-                    details.get("primaryImageSmall"),
-                    caption=details.get("objectDate", ""),
-                    use_column_width=True
-                )
-            
-            with text_col:
-                st.subheader(details.get("title", "Untitled"))
-                
-                # --- NEW: More Details ---
-                st.write(f"**Artist:** {details.get('artistDisplayName', 'Unknown')}")
-                
-                # --- NEW: "More from this Artist" Button ---
-                artist_name = details.get('artistDisplayName')
-                if artist_name and artist_name != "Unknown":
-                    if st.button(f"More from {artist_name}", key=f"artist_{object_id}"):
-                        st.session_state.page = 0
-                        # Search for this artist, clearing other filters
-                        with st.spinner(f"Finding more from {artist_name}..."):
-                            st.session_state.search_results = search_artworks(
-                                query=artist_name, 
-                                department_id=None, 
-                                is_highlight=False
-                            )
-                        get_object_details.clear()
-                        st.rerun()
-                # --- END NEW ---
-
-                artist_bio = details.get('artistDisplayBio')
-                if artist_bio:
-                    st.write(f"**Artist Bio:** {artist_bio}")
-                    
-                st.write(f"**Date:** {details.get('objectDate', 'Unknown')}")
-                st.write(f"**Medium:** {details.get('medium', 'Unknown')}")
-                
-                obj_name = details.get('objectName')
-                if obj_name:
-                    st.write(f"**Object Type:** {obj_name}")
-
-                culture = details.get('culture')
-                if culture:
-                    st.write(f"**Culture:** {culture}")
-
-                period = details.get('period')
-                if period:
-                    st.write(f"**Period:** {period}")
-                    
-                dims = details.get('dimensions')
-                if dims:
-                    st.write(f"**Dimensions:** {dims}")
-                
-                st.write(f"**Department:** {details.get('department', 'Unknown')}")
+    # Fetch all details for this page at once, then display them in order
+    with st.spinner("Loading artworks..."):
+        all_details = get_many_object_details(ids_to_show)
 
-                credit = details.get('creditLine')
-                if credit:
-                    st.write(f"**Credit Line:** {credit}")
-                # --- END More Details ---
-                
-                # Add a link to the official MET page
-                if details.get("objectURL"):
-                    st.link_button("View on MET Website", details["objectURL"])
-            
-            # --- NEW: Additional Images Gallery ---
-            additional_images = details.get("additionalImages")
-            if additional_images:
-                st.write("**Additional Images:**")
-                # Create a gallery with up to 4 columns
-                num_images = len(additional_images)
-                cols = st.columns(min(num_images, 4))
-                for i, img_url in enumerate(additional_images[:4]):
-                    with cols[i]:
-                        st.image(img_url, width=150)
-            # --- END Additional Images ---
-
-            # --- NEW: Interactive Tags ---
-            tags = details.get("tags")
-            if tags and isinstance(tags, list):
-                tag_terms = [tag.get("term") for tag in tags if tag.get("term")]
-                if tag_terms:
-                    st.write("**Explore Tags:**")
-                    # Use columns to lay out tags, max 5 per row for tidiness
-                    num_cols = min(len(tag_terms), 5)
-                    tag_cols = st.columns(num_cols)
-                    for i, term in enumerate(tag_terms):
-                        with tag_cols[i % num_cols]:
-                            if st.button(term, key=f"tag_{object_id}_{term}"):
-                                st.session_state.page = 0
-                                with st.spinner(f"Searching for '{term}'..."):
-                                    st.session_state.search_results = search_artworks(
-                                        query=term,
-                                        department_id=None,
-                                        is_highlight=False
-                                    )
-                                get_object_details.clear()
-                                st.rerun()
-            # --- END NEW ---
-
-            st.divider() # Add a line between results
+    # Most users click "Next Page", so start loading it while they read this one
+    next_ids = st.session_state.search_results[end_idx:end_idx + ITEMS_PER_PAGE]
+    if next_ids:
+        prefetch_object_details(next_ids)
 
+    for object_id, details in zip(ids_to_show, all_details):
+        if details:
+            render_artwork(object_id, details)
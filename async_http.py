@@ -0,0 +1,45 @@
+"""
+Process-wide httpx.AsyncClient running on a background event loop.
+
+This lives outside app.py because Streamlit re-executes the main script on
+every rerun, and outside st.cache_resource because clearing that cache would
+start a new loop thread and client while the old ones kept running.
+
+Limit: Streamlit's file watcher re-imports local modules that change while the
+server runs, so editing this file starts a fresh loop and client. The old pair
+is no longer used but stays idle until interpreter exit, when its own atexit
+hook closes it.
+"""
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+
+_lock = threading.Lock()
+_loop = None
+_client = None
+
+def get_client(make_client):
+    """
+    Returns (loop, client), creating them on first use.
+    `make_client` builds the httpx.AsyncClient; it runs once per import of this
+    module (normally once per process, see the module docstring).
+    """
+    global _loop, _client
+    with _lock:
+        if _client is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True, name="async-http").start()
+            _client = make_client()
+            atexit.register(_close)
+        return _loop, _client
+
+def _close():
+    """Closes the client's connections and stops the loop at interpreter exit."""
+    try:
+        asyncio.run_coroutine_threadsafe(_client.aclose(), _loop).result(timeout=5)
+    except concurrent.futures.TimeoutError:
+        # Don't block or fail interpreter exit on a slow close
+        pass
+    finally:
+        _loop.call_soon_threadsafe(_loop.stop)